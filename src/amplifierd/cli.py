@@ -61,9 +61,9 @@ def serve(
     if bundle:
         parsed: dict[str, str] = {}
         for b in bundle:
-            if "=" not in b:
+            name, sep, uri = b.partition("=")
+            if not sep:
                 raise click.BadParameter(f"Expected NAME=URI, got: {b}", param_hint="--bundle")
-            name, uri = b.split("=", 1)
             parsed[name] = uri
         existing = json.loads(os.environ.get("AMPLIFIERD_BUNDLES", "{}"))
         existing.update(parsed)
@@ -0,0 +1,21 @@
+"""Helpers for running independent awaitables concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import Any
+
+
+async def gather_settled(aws: Iterable[Awaitable[Any]]) -> list[Any]:
+    """Await *aws* concurrently and return their outcomes in order.
+
+    A failed awaitable yields its exception in place of a result, so one
+    failure does not cancel the others. Cancellation and other non-Exception
+    BaseExceptions are re-raised.
+    """
+    outcomes = await asyncio.gather(*aws, return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+    return outcomes
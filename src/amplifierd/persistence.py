@@ -34,6 +34,10 @@ try:
 except ImportError:
     _write_with_backup = None  # type: ignore[assignment]
 
+# json.dumps() builds a fresh JSONEncoder on every call once any option is
+# non-default (ensure_ascii=False here); reuse one for per-message lines.
+_encode_line = json.JSONEncoder(ensure_ascii=False).encode
+
 
 def _sanitize(msg: dict[str, Any]) -> dict[str, Any]:
     """Sanitize a message for JSON persistence.
@@ -53,15 +57,17 @@ def _atomic_write(path: Path, content: str) -> None:
         _write_with_backup(path, content)
     else:
         tmp = path.with_suffix(".tmp")
-        tmp.write_text(content, encoding="utf-8")
-        tmp.replace(path)
+        try:
+            tmp.write_text(content, encoding="utf-8")
+            tmp.replace(path)
+        except BaseException:
+            # Don't leave a partial temp file behind.
+            tmp.unlink(missing_ok=True)
+            raise
 
 
-def write_transcript(session_dir: Path, messages: list[dict[str, Any]]) -> None:
-    """Write messages to transcript.jsonl, filtering system/developer roles.
-
-    Full rewrite (not append) — context compaction can change earlier messages.
-    """
+def _transcript_lines(messages: list[dict[str, Any]]) -> list[str]:
+    """Serialize messages to JSONL lines, filtering system/developer roles."""
     lines: list[str] = []
     for msg in messages:
         try:
@@ -73,15 +79,26 @@ def write_transcript(session_dir: Path, messages: list[dict[str, Any]]) -> None:
             if msg_dict.get("role") in _EXCLUDED_ROLES:
                 continue
             sanitized = _sanitize(msg_dict)
-            lines.append(json.dumps(sanitized, ensure_ascii=False))
+            lines.append(_encode_line(sanitized))
         except Exception:  # noqa: BLE001
             logger.debug("Skipping unserializable message", exc_info=True)
+    return lines
 
+
+def _rewrite_transcript(session_dir: Path, lines: list[str]) -> None:
     content = "\n".join(lines) + "\n" if lines else ""
     session_dir.mkdir(parents=True, exist_ok=True)
     _atomic_write(session_dir / _TRANSCRIPT_FILENAME, content)
 
 
+def write_transcript(session_dir: Path, messages: list[dict[str, Any]]) -> None:
+    """Write messages to transcript.jsonl, filtering system/developer roles.
+
+    Full rewrite (not append) — context compaction can change earlier messages.
+    """
+    _rewrite_transcript(session_dir, _transcript_lines(messages))
+
+
 def write_metadata(session_dir: Path, metadata: dict[str, Any]) -> None:
     """Write metadata dict to metadata.json, merging with existing content."""
     if not session_dir.exists():
@@ -89,14 +106,14 @@ def write_metadata(session_dir: Path, metadata: dict[str, Any]) -> None:
     metadata_path = session_dir / _METADATA_FILENAME
 
     existing: dict[str, Any] = {}
-    if metadata_path.exists():
-        try:
-            existing = json.loads(metadata_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            pass
+    try:
+        existing = json.loads(metadata_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        pass
 
-    merged = {**existing, **metadata}
-    content = json.dumps(merged, indent=2, ensure_ascii=False)
+    # existing is a freshly parsed dict owned by this call; merge in place.
+    existing |= metadata
+    content = json.dumps(existing, indent=2, ensure_ascii=False)
     _atomic_write(metadata_path, content)
 
 
@@ -107,10 +124,12 @@ def load_transcript(session_dir: Path) -> list[dict[str, Any]]:
     if the transcript file does not exist.
     """
     transcript_path = session_dir / _TRANSCRIPT_FILENAME
-    if not transcript_path.exists():
-        raise FileNotFoundError(f"No transcript at {transcript_path}")
+    try:
+        text = transcript_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No transcript at {transcript_path}") from None
     messages: list[dict[str, Any]] = []
-    for line in transcript_path.read_text(encoding="utf-8").splitlines():
+    for line in text.split("\n"):
         line = line.strip()
         if line:
             try:
@@ -126,8 +145,6 @@ def load_metadata(session_dir: Path) -> dict[str, Any]:
     Returns an empty dict if the file doesn't exist or is unreadable.
     """
     metadata_path = session_dir / _METADATA_FILENAME
-    if not metadata_path.exists():
-        return {}
     try:
         return json.loads(metadata_path.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
@@ -139,13 +156,42 @@ class TranscriptSaveHook:
 
     Registered on tool:post (mid-turn durability) and
     orchestrator:complete (end-of-turn, catches no-tool turns).
-    Debounces by message count.
+    Debounces by message count, and coalesces events that arrive while a
+    write is in flight (e.g. parallel tool calls) into one follow-up write.
+
+    When the previously persisted lines are an unchanged prefix of the new
+    transcript (and the file on disk is still the one we wrote), only the
+    new tail is appended; otherwise -- e.g. after context compaction -- the
+    file is rewritten atomically.
     """
 
     def __init__(self, session: Any, session_dir: Path) -> None:
         self._session = session
         self._session_dir = session_dir
         self._last_count = 0
+        self._writing = False
+        self._dirty = False
+        self._persisted: list[str] = []
+        self._persisted_size: int | None = None
+
+    def _persist(self, messages: list[dict[str, Any]]) -> None:
+        lines = _transcript_lines(messages)
+        path = self._session_dir / _TRANSCRIPT_FILENAME
+        n = len(self._persisted)
+        try:
+            on_disk_size: int | None = path.stat().st_size
+        except FileNotFoundError:
+            on_disk_size = None
+
+        if n and on_disk_size == self._persisted_size and lines[:n] == self._persisted:
+            if len(lines) > n:
+                with path.open("a", encoding="utf-8") as fh:
+                    fh.write("".join(f"{line}\n" for line in lines[n:]))
+        else:
+            _rewrite_transcript(self._session_dir, lines)
+
+        self._persisted = lines
+        self._persisted_size = path.stat().st_size
 
     async def __call__(self, event: str, data: dict[str, Any]) -> Any:
         from amplifier_core.models import HookResult
@@ -160,16 +206,24 @@ class TranscriptSaveHook:
             if not context or not hasattr(context, "get_messages"):
                 return HookResult(action="continue")
 
-            messages = await context.get_messages()
-            count = len(messages)
-
-            if count <= self._last_count:
+            if self._writing:
+                # The in-flight writer re-reads the context when it finishes.
+                self._dirty = True
                 return HookResult(action="continue")
 
-            await asyncio.to_thread(
-                write_transcript, self._session_dir, list(messages)
-            )
-            self._last_count = count
+            self._writing = True
+            try:
+                while True:
+                    self._dirty = False
+                    messages = await context.get_messages()
+                    count = len(messages)
+                    if count > self._last_count:
+                        await asyncio.to_thread(self._persist, list(messages))
+                        self._last_count = count
+                    if not self._dirty:
+                        break
+            finally:
+                self._writing = False
 
         except Exception:  # noqa: BLE001
             logger.warning("Transcript save failed", exc_info=True)
@@ -213,7 +267,7 @@ class MetadataSaveHook:
             }
 
             if self._initial_metadata is not None:
-                updates = {**self._initial_metadata, **updates}
+                updates = self._initial_metadata | updates
                 self._initial_metadata = None
 
             write_metadata(self._session_dir, updates)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.metadata
 import logging
 from typing import Any
@@ -13,12 +14,16 @@ logger = logging.getLogger(__name__)
 _ENTRY_POINT_GROUP = "amplifierd.plugins"
 
 
-def _get_entry_points() -> list[importlib.metadata.EntryPoint]:
+@functools.cache
+def _get_entry_points() -> tuple[importlib.metadata.EntryPoint, ...]:
     """Return installed entry points for the plugin group.
 
-    Extracted as a standalone function for testability.
+    Extracted as a standalone function for testability.  Cached because
+    scanning every installed distribution's metadata is slow and the set of
+    installed plugins does not change within a process; each app lifespan
+    (e.g. every TestClient) would otherwise rescan.
     """
-    return list(importlib.metadata.entry_points(group=_ENTRY_POINT_GROUP))
+    return tuple(importlib.metadata.entry_points(group=_ENTRY_POINT_GROUP))
 
 
 def discover_plugins(disabled: list[str], state: Any = None) -> list[tuple[str, APIRouter]]:
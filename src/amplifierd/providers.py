@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -16,8 +17,19 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 _ENV_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?}")
 
+# Parsed provider lists keyed by settings path, tagged with the
+# (st_mtime_ns, st_size) signature they were read at.  Session create and
+# resume both call load_provider_config(); an unchanged file is a stat away.
+_provider_cache: dict[Path, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+
 
 def load_provider_config(home: Path | None = None) -> list[dict[str, Any]]:
     """Load provider configuration from ~/.amplifier/settings.yaml.
@@ -32,24 +44,33 @@ def load_provider_config(home: Path | None = None) -> list[dict[str, Any]]:
     if home is None:
         home = Path(os.environ.get("AMPLIFIER_HOME", Path.home() / ".amplifier"))
     settings_path = home / "settings.yaml"
-    if not settings_path.is_file():
+    try:
+        st = settings_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         logger.debug("No settings file at %s", settings_path)
         return []
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _provider_cache.get(settings_path)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
     try:
-        data = yaml.safe_load(settings_path.read_text()) or {}
+        data = yaml.load(settings_path.read_bytes(), Loader=_SafeLoader) or {}
     except Exception:
         logger.warning("Failed to read %s", settings_path, exc_info=True)
         return []
     providers = data.get("config", {}).get("providers", [])
     if not isinstance(providers, list):
-        return []
+        providers = []
+    _provider_cache[settings_path] = (signature, providers)
     logger.info(
         "Loaded %d provider(s) from %s: %s",
         len(providers),
         settings_path,
         [p.get("module", "?") for p in providers if isinstance(p, dict)],
     )
-    return providers
+    return list(providers)
 
 
 def expand_env_vars(value: Any) -> Any:
@@ -7,6 +7,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 
+from amplifierd.concurrency import gather_settled
 from amplifierd.models.bundles import (
     BundleDetail,
     BundleListResponse,
@@ -225,24 +226,29 @@ async def compose_bundles(request: Request, body: ComposeBundlesRequest) -> Bund
             detail=detail.model_dump(exclude_none=True),
         )
 
+    # Loads are independent network/disk round-trips; run them concurrently,
+    # once per distinct source, and report the first failure in request order.
+    sources = list(dict.fromkeys(body.bundles))
+    outcomes = dict(
+        zip(sources, await gather_settled(registry.load(s) for s in sources), strict=True)
+    )
     loaded: list[Any] = []
     for source in body.bundles:
-        try:
-            bundle = await registry.load(source)
-            loaded.append(bundle)
-        except Exception as exc:
-            logger.exception("Failed to load bundle '%s' during compose", source)
+        outcome = outcomes[source]
+        if isinstance(outcome, Exception):
+            logger.error("Failed to load bundle '%s' during compose", source, exc_info=outcome)
             detail = ProblemDetail(
                 type=ErrorTypeURI.BUNDLE_LOAD_ERROR,
                 title="Bundle Load Error",
                 status=502,
-                detail=f"Failed to load bundle '{source}': {exc}",
+                detail=f"Failed to load bundle '{source}': {outcome}",
                 instance=str(request.url.path),
             )
             raise HTTPException(
                 status_code=502,
                 detail=detail.model_dump(exclude_none=True),
             )
+        loaded.append(outcome)
 
     # Compose: start with first bundle, compose with each subsequent one
     result = loaded[0]
@@ -67,17 +67,12 @@ def _context_unavailable_error(path: str) -> HTTPException:
 
 def _build_messages_response(raw_messages: list[Any]) -> MessagesResponse:
     """Convert a list of raw message dicts/objects to MessagesResponse."""
-    items: list[MessageItem] = []
-    for msg in raw_messages:
-        if isinstance(msg, dict):
-            items.append(MessageItem(role=msg.get("role", ""), content=msg.get("content", "")))
-        else:
-            items.append(
-                MessageItem(
-                    role=getattr(msg, "role", ""),
-                    content=getattr(msg, "content", ""),
-                )
-            )
+    items = [
+        MessageItem(role=msg.get("role", ""), content=msg.get("content", ""))
+        if isinstance(msg, dict)
+        else MessageItem(role=getattr(msg, "role", ""), content=getattr(msg, "content", ""))
+        for msg in raw_messages
+    ]
     return MessagesResponse(messages=items, total=len(items))
 
 
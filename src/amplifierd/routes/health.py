@@ -67,7 +67,7 @@ async def health(request: Request) -> HealthResponse:
     uptime_seconds = round(time.time() - start_time, 2)
 
     session_manager = getattr(request.app.state, "session_manager", None)
-    active_sessions = len(session_manager.list_sessions()) if session_manager else 0
+    active_sessions = session_manager.session_count() if session_manager else 0
 
     return HealthResponse(
         status="healthy",
@@ -7,6 +7,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 
+from amplifierd.concurrency import gather_settled
 from amplifierd.models.bundles import BundleUpdateCheck, ReloadBundlesResponse, ReloadStatusResponse
 from amplifierd.models.errors import ErrorTypeURI, ProblemDetail
 
@@ -54,13 +55,15 @@ async def reload_bundles(request: Request) -> ReloadBundlesResponse:
     reloaded: list[str] = []
     failed: list[str] = []
 
-    for name in names:
-        try:
-            await registry.load(name)
-            reloaded.append(name)
-        except Exception:
-            logger.warning("Failed to reload bundle '%s'", name, exc_info=True)
+    # Each reload is an independent fetch; overlap them as reload_status does.
+    outcomes = await gather_settled(registry.load(name) for name in names)
+
+    for name, outcome in zip(names, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning("Failed to reload bundle '%s'", name, exc_info=outcome)
             failed.append(name)
+        else:
+            reloaded.append(name)
 
     return ReloadBundlesResponse(
         reloaded=reloaded,
@@ -77,7 +80,11 @@ async def reload_status(request: Request) -> ReloadStatusResponse:
     names: list[str] = registry.list_registered()
     bundle_checks: list[BundleUpdateCheck] = []
 
-    for name in names:
+    # Update checks are independent network/disk round-trips; run them
+    # concurrently rather than paying for each one in turn.
+    update_results = await gather_settled(registry.check_update(name) for name in names)
+
+    for name, update_info in zip(names, update_results, strict=True):
         state = None
         try:
             state = registry.get_state(name)
@@ -86,37 +93,17 @@ async def reload_status(request: Request) -> ReloadStatusResponse:
 
         current_version = getattr(state, "version", None) if state is not None else None
 
-        try:
-            update_info = await registry.check_update(name)
-        except Exception:
-            logger.warning("Failed to check updates for bundle '%s'", name, exc_info=True)
-            bundle_checks.append(
-                BundleUpdateCheck(
-                    name=name,
-                    current_version=current_version,
-                    available_version=None,
-                    has_update=False,
-                )
-            )
-            continue
-
-        if update_info is None:
-            bundle_checks.append(
-                BundleUpdateCheck(
-                    name=name,
-                    current_version=current_version,
-                    available_version=None,
-                    has_update=False,
-                )
-            )
-        else:
-            bundle_checks.append(
-                BundleUpdateCheck(
-                    name=name,
-                    current_version=current_version,
-                    available_version=getattr(update_info, "available_version", None),
-                    has_update=True,
-                )
+        if isinstance(update_info, Exception):
+            logger.warning("Failed to check updates for bundle '%s'", name, exc_info=update_info)
+            update_info = None
+
+        bundle_checks.append(
+            BundleUpdateCheck(
+                name=name,
+                current_version=current_version,
+                available_version=getattr(update_info, "available_version", None),
+                has_update=update_info is not None,
             )
+        )
 
     return ReloadStatusResponse(bundles=bundle_checks)
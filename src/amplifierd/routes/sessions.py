@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
@@ -29,6 +30,7 @@ from amplifierd.models.sessions import (
     SetModeRequest,
     StaleResponse,
 )
+from amplifierd.persistence import load_transcript, write_metadata
 from amplifierd.state.session_handle import SessionHandle, SessionStatus
 from amplifierd.state.session_manager import SessionManager
 
@@ -38,6 +40,27 @@ sessions_router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 _MAX_TREE_DEPTH = 50
 
+# Parsed transcripts keyed by path with the file's (mtime, size) when read;
+# a write changes that, so a stale entry is re-read.  Capped by total file
+# size, evicting the oldest entries first.
+_TRANSCRIPT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_transcript_cache: dict[Path, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+
+
+def _cache_transcript(
+    path: Path, signature: tuple[int, int], messages: list[dict[str, Any]]
+) -> None:
+    """Store a parsed transcript, evicting the oldest entries to stay under the byte cap."""
+    _transcript_cache.pop(path, None)
+    size = signature[1]
+    if size > _TRANSCRIPT_CACHE_MAX_BYTES:
+        return
+    total = sum(sig[1] for sig, _ in _transcript_cache.values())
+    while total + size > _TRANSCRIPT_CACHE_MAX_BYTES:
+        evicted_sig, _ = _transcript_cache.pop(next(iter(_transcript_cache)))
+        total -= evicted_sig[1]
+    _transcript_cache[path] = (signature, messages)
+
 
 def _get_handle_or_404(request: Request, session_id: str) -> SessionHandle:
     """Return SessionHandle or raise HTTPException 404 with RFC 7807 ProblemDetail body."""
@@ -211,12 +234,14 @@ async def patch_session(
     if body.working_dir is not None:
         metadata_updates["working_dir"] = body.working_dir
 
-    if metadata_updates and manager.sessions_dir:
-        session_dir = manager.sessions_dir / session_id
-        if session_dir.exists():
-            from amplifierd.persistence import write_metadata
+    # Resolve the on-disk session directory once; it decides both whether
+    # metadata is persisted and whether a disk-only session exists.
+    session_dir = manager.sessions_dir / session_id if manager.sessions_dir else None
+    if session_dir is not None and not session_dir.exists():
+        session_dir = None
 
-            write_metadata(session_dir, metadata_updates)
+    if metadata_updates and session_dir is not None:
+        write_metadata(session_dir, metadata_updates)
 
     if handle is not None:
         summary = _summarize(handle)
@@ -226,7 +251,7 @@ async def patch_session(
         ).model_dump(exclude_none=True)
 
     # Disk-only session — return minimal response
-    if manager.sessions_dir and (manager.sessions_dir / session_id).exists():
+    if session_dir is not None:
         return {"session_id": session_id, "updated": True}
 
     detail = ProblemDetail(
@@ -464,11 +489,9 @@ async def list_forks(request: Request, session_id: str) -> dict[str, Any]:
     _get_handle_or_404(request, session_id)
     manager = request.app.state.session_manager
 
-    all_sessions = manager.list_sessions()
     fork_summaries = [
         _summarize_from_dict(s).model_dump()
-        for s in all_sessions
-        if s.get("parent_session_id") == session_id
+        for s in manager.list_sessions(parent_session_id=session_id)
     ]
     return {"sessions": fork_summaries, "total": len(fork_summaries)}
 
@@ -492,8 +515,18 @@ async def get_transcript(request: Request, session_id: str) -> dict:
             instance=str(request.url.path),
         )
         raise HTTPException(status_code=404, detail=detail.model_dump(exclude_none=True))
-    transcript_path = sessions_dir / session_id / "transcript.jsonl"
-    if not transcript_path.exists():
+    session_dir = sessions_dir / session_id
+    transcript_path = session_dir / "transcript.jsonl"
+    try:
+        stat = transcript_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _transcript_cache.get(transcript_path)
+        if cached is not None and cached[0] == signature:
+            messages = cached[1]
+        else:
+            messages = load_transcript(session_dir)
+            _cache_transcript(transcript_path, signature, messages)
+    except FileNotFoundError:
         detail = ProblemDetail(
             type=ErrorTypeURI.SESSION_NOT_FOUND,
             title="Session Not Found",
@@ -501,26 +534,10 @@ async def get_transcript(request: Request, session_id: str) -> dict:
             detail=f"No transcript for session '{session_id}'",
             instance=str(request.url.path),
         )
-        raise HTTPException(status_code=404, detail=detail.model_dump(exclude_none=True))
-    messages = []
-    for line in transcript_path.read_text().strip().split("\n"):
-        if line.strip():
-            try:
-                messages.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+        raise HTTPException(status_code=404, detail=detail.model_dump(exclude_none=True)) from None
 
-    # Build revision signature for stale-change detection
-    try:
-        stat = transcript_path.stat()
-        mtime_ns = getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1_000_000_000))
-        revision = f"{int(mtime_ns)}:{int(stat.st_size)}"
-        from datetime import UTC, datetime
-
-        last_updated = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
-    except OSError:
-        revision = None
-        last_updated = None
+    revision = f"{signature[0]}:{signature[1]}"
+    last_updated = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
 
     return {
         "session_id": session_id,
@@ -723,8 +740,6 @@ async def update_metadata(request: Request, session_id: str, body: dict) -> dict
     if manager.sessions_dir:
         session_dir = manager.sessions_dir / session_id
         if session_dir.exists():
-            from amplifierd.persistence import write_metadata
-
             write_metadata(session_dir, body)
             return {"updated": True, "session_id": session_id}
 
@@ -36,7 +36,7 @@ class _Subscriber:
             return True
         if event_session_id == self.session_id:
             return True
-        if event_session_id in bus.get_descendants(self.session_id):
+        if event_session_id in bus.descendant_set(self.session_id):
             return True
         return False
 
@@ -50,6 +50,10 @@ class EventBus:
         self._subscribers: list[_Subscriber] = []
         self._lock = asyncio.Lock()  # Reserved for future concurrent-publish support
         self._children: dict[str, set[str]] = {}
+        # Memoised get_descendants() results, invalidated on any tree change.
+        # publish() consults this per subscriber per event, so the BFS only
+        # runs again after the tree has actually been modified.
+        self._descendants_cache: dict[str, frozenset[str]] = {}
 
     # ------------------------------------------------------------------
     # Properties
@@ -66,18 +70,29 @@ class EventBus:
 
     def register_child(self, parent_id: str, child_id: str) -> None:
         """Register *child_id* as a child of *parent_id*."""
-        self._children.setdefault(parent_id, set()).add(child_id)
+        children = self._children.setdefault(parent_id, set())
+        if child_id not in children:
+            children.add(child_id)
+            self._descendants_cache.clear()
 
     def unregister_child(self, parent_id: str, child_id: str) -> None:
         """Remove *child_id* from the children of *parent_id*."""
         children = self._children.get(parent_id)
-        if children is not None:
+        if children is not None and child_id in children:
             children.discard(child_id)
             if not children:
                 del self._children[parent_id]
+            self._descendants_cache.clear()
 
     def get_descendants(self, session_id: str) -> set[str]:
         """Return all transitive descendants of *session_id* via BFS."""
+        return set(self.descendant_set(session_id))
+
+    def descendant_set(self, session_id: str) -> frozenset[str]:
+        """Cached, read-only variant of :meth:`get_descendants`."""
+        cached = self._descendants_cache.get(session_id)
+        if cached is not None:
+            return cached
         visited: set[str] = set()
         queue: deque[str] = deque()
         # Seed with direct children
@@ -91,7 +106,9 @@ class EventBus:
             for child in self._children.get(current, ()):
                 if child not in visited:
                     queue.append(child)
-        return visited
+        result = frozenset(visited)
+        self._descendants_cache[session_id] = result
+        return result
 
     # ------------------------------------------------------------------
     # Publish (SYNCHRONOUS – non-blocking)
@@ -105,24 +122,29 @@ class EventBus:
         correlation_id: str | None = None,
     ) -> None:
         """Publish an event to all matching subscribers (non-blocking)."""
-        event = TransportEvent(
-            event_name=event_name,
-            data=data,
-            session_id=session_id,
-            timestamp=datetime.now(UTC).isoformat(),
-            correlation_id=correlation_id,
-        )
+        event: TransportEvent | None = None
         for sub in self._subscribers:
-            if sub.matches(session_id, self):
+            if not sub.matches(session_id, self):
+                continue
+            if event is None:
+                # Built on first match, so events nobody is listening to never
+                # pay for the timestamp or the envelope.
+                event = TransportEvent(
+                    event_name=event_name,
+                    data=data,
+                    session_id=session_id,
+                    timestamp=datetime.now(UTC).isoformat(),
+                    correlation_id=correlation_id,
+                )
+            try:
+                sub.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Backpressure: drop oldest event then retry
                 try:
-                    sub.queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    # Backpressure: drop oldest event then retry
-                    try:
-                        sub.queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        pass
-                    sub.queue.put_nowait(event)
+                    sub.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                sub.queue.put_nowait(event)
 
     # ------------------------------------------------------------------
     # Subscribe (async generator)
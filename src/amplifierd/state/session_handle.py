@@ -140,14 +140,20 @@ class SessionHandle:
         ]
         all_events = list(ALL_EVENTS) + _delegate_events
 
+        # The session id and bus never change for a handle, so resolve them
+        # once here instead of through properties on every event.
+        # correlation_id is per-prompt and must still be read live.
+        session_id = self.session_id
+        publish = self._event_bus.publish
+
         registered = 0
         for event_name in all_events:
 
             async def _on_event(
                 name: str, data: dict[str, Any], _evt: str = event_name
             ) -> HookResult:
-                self._event_bus.publish(
-                    session_id=self.session_id,
+                publish(
+                    session_id=session_id,
                     event_name=_evt,
                     data=data,
                     correlation_id=self._correlation_id,
@@ -160,7 +166,7 @@ class SessionHandle:
             except Exception:
                 logger.debug("Failed to register hook for event %s", event_name, exc_info=True)
 
-        logger.debug("Wired %d event hooks for session %s", registered, self.session_id)
+        logger.debug("Wired %d event hooks for session %s", registered, session_id)
 
     def _wire_display(self) -> None:
         """Wire an EventBusDisplaySystem onto the coordinator.
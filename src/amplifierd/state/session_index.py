@@ -10,7 +10,7 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionIndexEntry:
     session_id: str
     status: str
@@ -27,6 +27,10 @@ class SessionIndex:
     def __init__(self, path: Path) -> None:
         self._path = path
         self._entries: dict[str, SessionIndexEntry] = {}
+        # Content and (mtime_ns, size) of the last successful save(); an unchanged
+        # index is not rewritten while the file on disk is still the one we wrote.
+        self._saved: str | None = None
+        self._saved_stat: tuple[int, int] | None = None
 
     def add(self, entry: SessionIndexEntry) -> None:
         self._entries[entry.session_id] = entry
@@ -51,11 +55,26 @@ class SessionIndex:
         return list(self._entries.values())
 
     def save(self) -> None:
+        content = json.dumps([asdict(e) for e in self._entries.values()], indent=2)
+        if content == self._saved and self._stat() == self._saved_stat:
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp = self._path.with_suffix(".json.tmp")
-        data = [asdict(e) for e in self._entries.values()]
-        tmp.write_text(json.dumps(data, indent=2))
-        os.rename(tmp, self._path)
+        try:
+            tmp.write_text(content)
+            os.replace(tmp, self._path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._saved = content
+        self._saved_stat = self._stat()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     @classmethod
     def load(cls, path: Path) -> SessionIndex:
@@ -76,12 +95,10 @@ class SessionIndex:
         index = cls(index_path)
         if not sessions_dir.exists():
             return index
-        for sdir in sessions_dir.iterdir():
-            if not sdir.is_dir():
-                continue
-            meta_path = sdir / "metadata.json"
-            if not meta_path.exists():
-                continue
+        with os.scandir(sessions_dir) as it:
+            session_dirs = [e for e in it if e.is_dir()]
+        for sdir in session_dirs:
+            meta_path = Path(sdir.path, "metadata.json")
             try:
                 meta = json.loads(meta_path.read_text())
                 index.add(
@@ -94,6 +111,9 @@ class SessionIndex:
                         parent_session_id=meta.get("parent_session_id"),
                     )
                 )
+            except FileNotFoundError:
+                # Not a persisted session.
+                continue
             except (json.JSONDecodeError, KeyError, TypeError, ValueError):
-                logger.warning("Skipping unreadable session dir: %s", sdir)
+                logger.warning("Skipping unreadable session dir: %s", sdir.path)
         return index
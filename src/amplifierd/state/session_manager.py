@@ -9,11 +9,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from amplifierd.config import DaemonSettings
+from amplifierd.persistence import load_metadata, load_transcript, register_persistence_hooks
+from amplifierd.providers import inject_providers, load_provider_config
 from amplifierd.state.event_bus import EventBus
 from amplifierd.state.session_handle import SessionHandle
 from amplifierd.state.session_index import SessionIndex, SessionIndexEntry
@@ -70,8 +73,6 @@ class SessionManager:
         Tilde (``~``) prefixes are expanded to the user's home directory
         so the stored path is always absolute.
         """
-        import os
-
         if request_working_dir:
             return os.path.expanduser(request_working_dir)
         if self._settings.default_working_dir:
@@ -119,17 +120,22 @@ class SessionManager:
         """Get a session by ID, or None if not found."""
         return self._sessions.get(session_id)
 
-    def list_sessions(self) -> list[dict]:
+    def list_sessions(self, *, parent_session_id: str | None = None) -> list[dict]:
         """List all sessions: active in-memory sessions first, then historical from index.
 
+        When *parent_session_id* is given, only direct children of that
+        session are returned; non-matching sessions are skipped before their
+        dicts are built.
+
         Returns a list of dicts with a consistent shape:
             session_id, status, bundle, created_at, last_activity,
             parent_session_id, stale, is_active, working_dir
         """
-        active_ids = set(self._sessions)
         result: list[dict] = []
 
         for handle in self._sessions.values():
+            if parent_session_id is not None and handle.parent_id != parent_session_id:
+                continue
             result.append(
                 {
                     "session_id": handle.session_id,
@@ -146,7 +152,10 @@ class SessionManager:
 
         if self._index is not None:
             for entry in self._index.list_entries():
-                if entry.session_id not in active_ids:
+                if parent_session_id is not None and entry.parent_session_id != parent_session_id:
+                    continue
+                # Membership test against the live dict; no need to snapshot ids.
+                if entry.session_id not in self._sessions:
                     result.append(
                         {
                             "session_id": entry.session_id,
@@ -163,6 +172,15 @@ class SessionManager:
 
         return result
 
+    def session_count(self) -> int:
+        """Return ``len(self.list_sessions())`` without building the session dicts."""
+        count = len(self._sessions)
+        if self._index is not None:
+            count += sum(
+                1 for entry in self._index.list_entries() if entry.session_id not in self._sessions
+            )
+        return count
+
     async def create(
         self,
         *,
@@ -195,8 +213,6 @@ class SessionManager:
 
         # Inject providers from ~/.amplifier/settings.yaml BEFORE prepare()
         # so the activation step downloads and installs their dependencies.
-        from amplifierd.providers import inject_providers, load_provider_config
-
         providers = load_provider_config()
         inject_providers(bundle, providers)
 
@@ -205,13 +221,15 @@ class SessionManager:
 
         # Register transcript/metadata persistence hooks
         if self._sessions_dir:
-            from amplifierd.persistence import register_persistence_hooks
-
             session_dir = self._sessions_dir / session.session_id
             session_dir.mkdir(parents=True, exist_ok=True)
             info_path = session_dir / "session-info.json"
-            if not info_path.exists():
-                info_path.write_text(json.dumps({"working_dir": str(wd)}))
+            # Exclusive create keeps an existing file without a check-then-write race.
+            try:
+                with info_path.open("x") as fh:
+                    fh.write(json.dumps({"working_dir": str(wd)}))
+            except FileExistsError:
+                pass
             register_persistence_hooks(
                 session,
                 session_dir,
@@ -273,8 +291,6 @@ class SessionManager:
             raise FileNotFoundError(f"No session directory for {session_id}")
 
         # 1. Load transcript from disk (offload sync I/O to thread)
-        from amplifierd.persistence import load_metadata, load_transcript
-
         transcript = await asyncio.to_thread(load_transcript, session_dir)
 
         # 2. Handle orphaned tool calls
@@ -306,8 +322,6 @@ class SessionManager:
         # 4. Load bundle, inject providers, prepare, create session
         bundle = await self._bundle_registry.load(bundle_name)
 
-        from amplifierd.providers import inject_providers, load_provider_config
-
         providers = load_provider_config()
         inject_providers(bundle, providers)
 
@@ -333,8 +347,6 @@ class SessionManager:
                 await context.set_messages(system_msgs + list(restored))
 
         # 6. Register persistence hooks
-        from amplifierd.persistence import register_persistence_hooks
-
         register_persistence_hooks(session, session_dir)
 
         # 7. Register spawn capability
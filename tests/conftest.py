@@ -0,0 +1,42 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _make_fake_session(session_id: str = "fake-session-1") -> SimpleNamespace:
+    """Create a minimal fake AmplifierSession for testing."""
+    fake_coordinator = SimpleNamespace(
+        request_cancel=lambda immediate: None,
+        hooks=MagicMock(),
+    )
+    return SimpleNamespace(
+        session_id=session_id,
+        parent_id=None,
+        coordinator=fake_coordinator,
+        cleanup=AsyncMock(),
+        execute=AsyncMock(return_value="ok"),
+    )
+
+
+def _make_mock_registry(session_id: str = "fake-session-1") -> MagicMock:
+    """Create a mock BundleRegistry that returns fake sessions."""
+    fake_session = _make_fake_session(session_id)
+    mock_prepared = MagicMock()
+    mock_prepared.create_session = AsyncMock(return_value=fake_session)
+    mock_bundle = MagicMock()
+    mock_bundle.prepare = AsyncMock(return_value=mock_prepared)
+    mock_registry = MagicMock()
+    mock_registry.load = AsyncMock(return_value=mock_bundle)
+    return mock_registry
+
+
+@pytest.fixture()
+def mock_registry_factory() -> Callable[[str], MagicMock]:
+    """Factory for mock BundleRegistry objects whose sessions use the given id."""
+    return _make_mock_registry
@@ -0,0 +1,27 @@
+"""Shared test helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class ConcurrencyProbe:
+    """Wraps a fake registry call and records how many were in flight at once."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    def wrap(self, fn: Callable[[str], Any]) -> Callable[[str], Awaitable[Any]]:
+        async def probed(arg: str) -> Any:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                self.in_flight -= 1
+            return fn(arg)
+
+        return probed
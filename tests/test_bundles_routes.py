@@ -13,6 +13,7 @@ from amplifierd.app import create_app
 from amplifierd.config import DaemonSettings
 from amplifierd.state.event_bus import EventBus
 from amplifierd.state.session_manager import SessionManager
+from tests.helpers import ConcurrencyProbe
 
 # -- Helpers --
 
@@ -379,6 +380,42 @@ class TestComposeBundlesEndpoint:
         data = resp.json()
         assert "name" in data
 
+    def test_compose_bundles_loads_concurrently(self, client: TestClient, app: FastAPI) -> None:
+        """POST /bundles/compose overlaps loads and reports the first failure in order."""
+        probe = ConcurrencyProbe()
+
+        def fake_load(source: str) -> SimpleNamespace:
+            if source.startswith("broken"):
+                raise RuntimeError(f"{source} unavailable")
+            return _make_fake_bundle(source)
+
+        app.state.bundle_registry = SimpleNamespace(load=probe.wrap(fake_load))
+        resp = client.post(
+            "/bundles/compose",
+            json={"bundles": ["bundle-a", "broken-1", "broken-2"]},
+        )
+        assert resp.status_code == 502
+        assert probe.peak == 3
+        assert "broken-1" in resp.json()["detail"]["detail"]
+
+    def test_compose_bundles_loads_each_source_once(self, client: TestClient, app: FastAPI) -> None:
+        """A source listed twice is loaded once and still composed in request order."""
+        bundle = _make_fake_bundle("bundle-a")
+        bundle.compose = lambda other: bundle
+        loads: list[str] = []
+
+        async def fake_load(source: str) -> SimpleNamespace:
+            loads.append(source)
+            return bundle
+
+        app.state.bundle_registry = SimpleNamespace(load=fake_load)
+        resp = client.post(
+            "/bundles/compose",
+            json={"bundles": ["bundle-a", "bundle-a"]},
+        )
+        assert resp.status_code == 200
+        assert loads == ["bundle-a"]
+
     def test_compose_bundles_returns_400_when_empty_list(
         self, client: TestClient, app: FastAPI
     ) -> None:
@@ -0,0 +1,34 @@
+"""Tests for gather_settled()."""
+
+import asyncio
+
+import pytest
+
+from amplifierd.concurrency import gather_settled
+
+
+@pytest.mark.unit
+class TestGatherSettled:
+    """Verify outcomes keep input order and only Exceptions are captured."""
+
+    async def test_returns_results_and_exceptions_in_order(self):
+        """A failing awaitable yields its exception without cancelling the others."""
+        err = RuntimeError("boom")
+
+        async def _ok(value: int) -> int:
+            await asyncio.sleep(0)
+            return value
+
+        async def _fail() -> int:
+            raise err
+
+        assert await gather_settled([_ok(1), _fail(), _ok(3)]) == [1, err, 3]
+
+    async def test_reraises_cancellation(self):
+        """CancelledError is not swallowed into the outcome list."""
+
+        async def _cancelled() -> None:
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await gather_settled([_cancelled()])
@@ -134,6 +134,20 @@ class TestGetMessages:
         assert data["messages"][0]["content"] == "Hello"
         assert data["messages"][1]["role"] == "assistant"
 
+    def test_returns_messages_from_objects(self, client: TestClient, app: FastAPI) -> None:
+        """GET accepts attribute-style message objects alongside dicts."""
+        messages = [
+            SimpleNamespace(role="user", content="Hello"),
+            {"role": "assistant", "content": "Hi there"},
+        ]
+        fake_context = SimpleNamespace(get_messages=lambda: messages)
+        _register_session(app, "sess-get-obj", context=fake_context)
+        resp = client.get("/sessions/sess-get-obj/context/messages")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [m["role"] for m in data["messages"]] == ["user", "assistant"]
+        assert data["messages"][0]["content"] == "Hello"
+
     def test_tolerates_context_get_messages_failure(self, client: TestClient, app: FastAPI) -> None:
         """GET returns empty messages gracefully if get_messages() raises."""
 
@@ -151,3 +151,53 @@ class TestEventBus:
         assert received_b[1].sequence == 2
         # Events must be distinct objects (not shared references)
         assert received_a[0] is not received_b[0]
+
+    def test_descendants_track_tree_changes(self):
+        """get_descendants reflects children added and removed after a lookup."""
+        bus = EventBus()
+        bus.register_child("root", "a")
+        assert bus.get_descendants("root") == {"a"}
+
+        bus.register_child("a", "b")
+        assert bus.get_descendants("root") == {"a", "b"}
+
+        bus.unregister_child("a", "b")
+        assert bus.get_descendants("root") == {"a"}
+
+        # Returned sets are caller-owned copies
+        bus.get_descendants("root").add("bogus")
+        assert bus.get_descendants("root") == {"a"}
+        assert bus.descendant_set("root") == frozenset({"a"})
+
+    async def test_publish_without_matching_subscriber_builds_no_event(self, monkeypatch):
+        """Events with no matching subscriber skip the envelope and timestamp."""
+        import amplifierd.state.event_bus as event_bus_mod
+
+        built: list[TransportEvent] = []
+
+        def _counting_event(**kwargs):
+            event = TransportEvent(**kwargs)
+            built.append(event)
+            return event
+
+        monkeypatch.setattr(event_bus_mod, "TransportEvent", _counting_event)
+        bus = EventBus()
+        bus.publish("s1", "evt.none", {})
+        assert built == []
+
+        received: list[TransportEvent] = []
+
+        async def _consume():
+            async for event in bus.subscribe(session_id="s1"):
+                received.append(event)
+                break
+
+        task = asyncio.create_task(_consume())
+        await asyncio.sleep(0.05)
+        bus.publish("s2", "evt.other", {})
+        bus.publish("s1", "evt.mine", {"k": 1})
+        await asyncio.wait_for(task, timeout=2.0)
+
+        assert received[0].event_name == "evt.mine"
+        assert received[0].timestamp
+        assert len(built) == 2  # the published envelope plus the subscriber's copy
@@ -11,6 +11,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from amplifierd.persistence import (
+    load_metadata,
+    load_transcript,
     register_persistence_hooks,
     write_metadata,
     write_transcript,
@@ -21,6 +23,15 @@ def _msg(role: str, content: str | None = "text") -> dict[str, Any]:
     return {"role": role, "content": content}
 
 
+def _session_with_messages(messages: list[dict[str, Any]]) -> SimpleNamespace:
+    """Fake session whose context returns a snapshot of *messages* on each call."""
+    context = MagicMock()
+    context.get_messages = AsyncMock(side_effect=lambda: list(messages))
+    coordinator = MagicMock()
+    coordinator.get = MagicMock(return_value=context)
+    return SimpleNamespace(coordinator=coordinator)
+
+
 @pytest.mark.unit
 class TestWriteTranscript:
     """Tests for write_transcript()."""
@@ -68,6 +79,20 @@ class TestWriteTranscript:
         assert session_dir.exists()
         assert (session_dir / "transcript.jsonl").exists()
 
+    def test_failed_write_leaves_no_temp_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import amplifierd.persistence as persistence
+
+        def _failing_replace(self: Path, target: Path) -> Path:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(persistence, "_write_with_backup", None)
+        monkeypatch.setattr(Path, "replace", _failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            write_transcript(tmp_path, [_msg("user", "hello")])
+        assert list(tmp_path.iterdir()) == []
+
 
 @pytest.mark.unit
 class TestWriteMetadata:
@@ -107,6 +132,35 @@ class TestWriteMetadata:
         assert meta["key"] == "val"
 
 
+@pytest.mark.unit
+class TestLoadHelpers:
+    """Tests for load_transcript() and load_metadata()."""
+
+    def test_load_transcript_missing_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="No transcript at"):
+            load_transcript(tmp_path)
+
+    def test_load_transcript_roundtrip(self, tmp_path: Path) -> None:
+        write_transcript(tmp_path, [_msg("user", "hello"), _msg("assistant", "hi")])
+        assert [m["role"] for m in load_transcript(tmp_path)] == ["user", "assistant"]
+
+    def test_transcript_roundtrip_keeps_non_ascii(self, tmp_path: Path) -> None:
+        messages = [
+            _msg("user", "h\u00e9llo \u2713"),
+            {"role": "assistant", "content": None, "tool_calls": [{"id": "t1"}]},
+        ]
+        write_transcript(tmp_path, messages)
+        assert "h\u00e9llo \u2713" in (tmp_path / "transcript.jsonl").read_text(encoding="utf-8")
+        assert load_transcript(tmp_path) == messages
+
+    def test_load_metadata_missing_returns_empty(self, tmp_path: Path) -> None:
+        assert load_metadata(tmp_path) == {}
+
+    def test_load_metadata_corrupt_returns_empty(self, tmp_path: Path) -> None:
+        (tmp_path / "metadata.json").write_text("{{not json")
+        assert load_metadata(tmp_path) == {}
+
+
 @pytest.mark.unit
 class TestTranscriptSaveHook:
     """Tests for TranscriptSaveHook."""
@@ -116,11 +170,7 @@ class TestTranscriptSaveHook:
         from amplifierd.persistence import TranscriptSaveHook
 
         messages = [_msg("user", "hello")]
-        context = MagicMock()
-        context.get_messages = AsyncMock(return_value=messages)
-        coordinator = MagicMock()
-        coordinator.get = MagicMock(return_value=context)
-        session = SimpleNamespace(coordinator=coordinator)
+        session = _session_with_messages(messages)
 
         session_dir = tmp_path / "session-abc"
         hook = TranscriptSaveHook(session, session_dir)
@@ -141,11 +191,7 @@ class TestTranscriptSaveHook:
         from amplifierd.persistence import TranscriptSaveHook
 
         messages: list[dict[str, Any]] = [_msg("user", "hello")]
-        context = MagicMock()
-        context.get_messages = AsyncMock(return_value=messages)
-        coordinator = MagicMock()
-        coordinator.get = MagicMock(return_value=context)
-        session = SimpleNamespace(coordinator=coordinator)
+        session = _session_with_messages(messages)
 
         session_dir = tmp_path / "session-abc"
         hook = TranscriptSaveHook(session, session_dir)
@@ -155,11 +201,87 @@ class TestTranscriptSaveHook:
 
         # Add a message — should write again
         messages.append(_msg("assistant", "world"))
-        context.get_messages = AsyncMock(return_value=messages)
         await hook("orchestrator:complete", {})
         lines = (session_dir / "transcript.jsonl").read_text().strip().split("\n")
         assert len(lines) == 2
 
+    @pytest.mark.asyncio
+    async def test_coalesces_events_during_inflight_write(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import asyncio
+        import threading
+
+        import amplifierd.persistence as persistence
+        from amplifierd.persistence import TranscriptSaveHook
+
+        messages: list[dict[str, Any]] = [_msg("user", "hello")]
+        session = _session_with_messages(messages)
+
+        release = threading.Event()
+        writes: list[int] = []
+        real_lines = persistence._transcript_lines
+
+        def _slow_lines(msgs: list[dict[str, Any]]) -> list[str]:
+            release.wait(timeout=5)
+            writes.append(len(msgs))
+            return real_lines(msgs)
+
+        monkeypatch.setattr(persistence, "_transcript_lines", _slow_lines)
+        session_dir = tmp_path / "session-abc"
+        hook = TranscriptSaveHook(session, session_dir)
+
+        first = asyncio.create_task(hook("tool:post", {}))
+        await asyncio.sleep(0.05)  # first write is now blocked in the thread
+        for i in range(3):
+            messages.append(_msg("tool", f"result {i}"))
+            await hook("tool:post", {})
+        release.set()
+        await first
+
+        # One initial write plus a single coalesced follow-up with everything
+        assert writes == [1, 4]
+        lines = (session_dir / "transcript.jsonl").read_text().strip().split("\n")
+        assert len(lines) == 4
+
+    @pytest.mark.asyncio
+    async def test_appends_tail_when_prefix_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import amplifierd.persistence as persistence
+        from amplifierd.persistence import TranscriptSaveHook
+
+        messages: list[dict[str, Any]] = [_msg("user", "hello")]
+        session = _session_with_messages(messages)
+
+        rewrites: list[Path] = []
+        real_atomic = persistence._atomic_write
+
+        def _counting_atomic(path: Path, content: str) -> None:
+            rewrites.append(path)
+            real_atomic(path, content)
+
+        monkeypatch.setattr(persistence, "_atomic_write", _counting_atomic)
+        session_dir = tmp_path / "session-abc"
+        hook = TranscriptSaveHook(session, session_dir)
+
+        await hook("orchestrator:complete", {})
+        messages.append(_msg("assistant", "world"))
+        await hook("orchestrator:complete", {})
+        assert len(rewrites) == 1
+        assert [m["content"] for m in load_transcript(session_dir)] == ["hello", "world"]
+
+        # Compaction rewrote an earlier message: fall back to a full rewrite
+        messages[0] = _msg("user", "summary")
+        messages.append(_msg("user", "next"))
+        await hook("orchestrator:complete", {})
+        assert len(rewrites) == 2
+        assert [m["content"] for m in load_transcript(session_dir)] == [
+            "summary",
+            "world",
+            "next",
+        ]
+
 
 @pytest.mark.unit
 class TestRegisterPersistenceHooks:
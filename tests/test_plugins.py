@@ -112,3 +112,16 @@ class TestDiscoverPlugins:
             discover_plugins(disabled=[], state=sentinel)
 
         module.create_router.assert_called_once_with(sentinel)
+
+    def test_entry_points_scanned_once(self):
+        """Installed entry points are looked up once per process, not per lifespan."""
+        from amplifierd.plugins import _get_entry_points
+
+        _get_entry_points.cache_clear()
+        try:
+            with patch("importlib.metadata.entry_points", return_value=[]) as scan:
+                discover_plugins(disabled=[])
+                discover_plugins(disabled=[])
+            scan.assert_called_once()
+        finally:
+            _get_entry_points.cache_clear()
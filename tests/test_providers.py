@@ -64,6 +64,49 @@ class TestLoadProviderConfig:
         result = load_provider_config(home=tmp_path)
         assert result == []
 
+    def test_unchanged_file_not_reparsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import yaml
+
+        from amplifierd.providers import load_provider_config
+
+        (tmp_path / "settings.yaml").write_text(
+            "config:\n  providers:\n  - module: provider-anthropic\n"
+        )
+        calls: list[str] = []
+        real_load = yaml.load
+
+        def _counting_load(stream: Any, Loader: Any) -> Any:  # noqa: N803
+            calls.append(stream)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", _counting_load)
+        first = load_provider_config(home=tmp_path)
+        second = load_provider_config(home=tmp_path)
+        assert first == second
+        assert first is not second
+        assert len(calls) == 1
+
+    def test_python_tags_rejected(self, tmp_path: Path) -> None:
+        from amplifierd.providers import load_provider_config
+
+        (tmp_path / "settings.yaml").write_text("!!python/object/apply:os.getcwd []\n")
+        assert load_provider_config(home=tmp_path) == []
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path) -> None:
+        from amplifierd.providers import load_provider_config
+
+        settings = tmp_path / "settings.yaml"
+        settings.write_text("config:\n  providers:\n  - module: provider-a\n")
+        assert [p["module"] for p in load_provider_config(home=tmp_path)] == ["provider-a"]
+
+        settings.write_text(
+            "config:\n  providers:\n  - module: provider-a\n  - module: provider-b\n"
+        )
+        result = load_provider_config(home=tmp_path)
+        assert [p["module"] for p in result] == ["provider-a", "provider-b"]
+
 
 @pytest.mark.unit
 class TestExpandEnvVars:
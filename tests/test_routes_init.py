@@ -31,65 +31,28 @@ class TestAllRouters:
         for r in ALL_ROUTERS:
             assert isinstance(r, APIRouter), f"{r!r} is not an APIRouter"
 
-    def test_all_routers_contains_health_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.health import health_router
-
-        assert health_router in ALL_ROUTERS
-
-    def test_all_routers_contains_sessions_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.sessions import sessions_router
-
-        assert sessions_router in ALL_ROUTERS
-
-    def test_all_routers_contains_events_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.events import events_router
-
-        assert events_router in ALL_ROUTERS
-
-    def test_all_routers_contains_approvals_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.approvals import approvals_router
-
-        assert approvals_router in ALL_ROUTERS
-
-    def test_all_routers_contains_agents_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.agents import agents_router
-
-        assert agents_router in ALL_ROUTERS
-
-    def test_all_routers_contains_bundles_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.bundles import bundles_router
-
-        assert bundles_router in ALL_ROUTERS
-
-    def test_all_routers_contains_context_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.context import context_router
-
-        assert context_router in ALL_ROUTERS
-
-    def test_all_routers_contains_modules_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.modules import modules_router
-
-        assert modules_router in ALL_ROUTERS
-
-    def test_all_routers_contains_validation_router(self):
-        from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.validation import validation_router
-
-        assert validation_router in ALL_ROUTERS
+    @pytest.mark.parametrize(
+        ("module", "attr"),
+        [
+            ("health", "health_router"),
+            ("sessions", "sessions_router"),
+            ("events", "events_router"),
+            ("approvals", "approvals_router"),
+            ("agents", "agents_router"),
+            ("bundles", "bundles_router"),
+            ("context", "context_router"),
+            ("modules", "modules_router"),
+            ("validation", "validation_router"),
+            ("reload", "reload_router"),
+        ],
+    )
+    def test_all_routers_contains_router(self, module: str, attr: str):
+        import importlib
 
-    def test_all_routers_contains_reload_router(self):
         from amplifierd.routes import ALL_ROUTERS
-        from amplifierd.routes.reload import reload_router
 
-        assert reload_router in ALL_ROUTERS
+        router = getattr(importlib.import_module(f"amplifierd.routes.{module}"), attr)
+        assert router in ALL_ROUTERS
 
 
 @pytest.mark.unit
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import Callable, Generator
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -12,35 +11,8 @@ from fastapi.testclient import TestClient
 from amplifierd.app import create_app
 
 
-def _make_fake_session(session_id: str = "fake-session-1") -> SimpleNamespace:
-    """Create a minimal fake AmplifierSession for testing."""
-    fake_coordinator = SimpleNamespace(
-        request_cancel=lambda immediate: None,
-        hooks=MagicMock(),
-    )
-    return SimpleNamespace(
-        session_id=session_id,
-        parent_id=None,
-        coordinator=fake_coordinator,
-        cleanup=AsyncMock(),
-        execute=AsyncMock(return_value="ok"),
-    )
-
-
-def _make_mock_registry(session_id: str = "fake-session-1") -> MagicMock:
-    """Create a mock BundleRegistry that returns fake sessions."""
-    fake_session = _make_fake_session(session_id)
-    mock_prepared = MagicMock()
-    mock_prepared.create_session = AsyncMock(return_value=fake_session)
-    mock_bundle = MagicMock()
-    mock_bundle.prepare = AsyncMock(return_value=mock_prepared)
-    mock_registry = MagicMock()
-    mock_registry.load = AsyncMock(return_value=mock_bundle)
-    return mock_registry
-
-
 @pytest.fixture()
-def client() -> Generator[TestClient]:
+def client(mock_registry_factory: Callable[[str], MagicMock]) -> Generator[TestClient]:
     """Test client with mocked bundle registry for session creation.
 
     The mock is applied AFTER the lifespan runs (inside the context manager)
@@ -49,7 +21,7 @@ def client() -> Generator[TestClient]:
     app = create_app()
     with TestClient(app) as c:
         # Override after lifespan so mock isn't replaced by the real registry
-        mock_registry = _make_mock_registry()
+        mock_registry = mock_registry_factory("fake-session-1")
         c.app.state.bundle_registry = mock_registry  # type: ignore[union-attr]
         c.app.state.session_manager._bundle_registry = mock_registry  # type: ignore[union-attr]  # noqa: SLF001
         yield c
@@ -129,3 +129,26 @@ async def test_destroy_updates_index_status(tmp_path, session_manager_with_index
     entry = manager._index.get("to-destroy-idx")  # noqa: SLF001
     assert entry is not None
     assert entry.status == "completed"
+
+
+async def test_create_keeps_existing_session_info(tmp_path, monkeypatch, mock_registry_factory):
+    """create() writes session-info.json once and never overwrites an existing one."""
+    monkeypatch.setenv("AMPLIFIER_HOME", str(tmp_path / "home"))
+    sessions_dir = tmp_path / "sessions"
+
+    manager = SessionManager(
+        event_bus=EventBus(),
+        settings=DaemonSettings(),
+        bundle_registry=mock_registry_factory("fresh"),
+        sessions_dir=sessions_dir,
+    )
+    await manager.create(bundle_name="b", working_dir=str(tmp_path / "wd-a"))
+    info = json.loads((sessions_dir / "fresh" / "session-info.json").read_text())
+    assert info == {"working_dir": str(tmp_path / "wd-a")}
+
+    existing = sessions_dir / "kept"
+    existing.mkdir()
+    (existing / "session-info.json").write_text('{"working_dir": "/original"}')
+    manager._bundle_registry = mock_registry_factory("kept")  # noqa: SLF001
+    await manager.create(bundle_name="b", working_dir=str(tmp_path / "wd-b"))
+    assert json.loads((existing / "session-info.json").read_text()) == {"working_dir": "/original"}
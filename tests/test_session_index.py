@@ -1,4 +1,5 @@
 import json
+import os
 
 import pytest
 
@@ -38,6 +39,59 @@ def test_atomic_write(tmp_path):
     assert (tmp_path / "index.json").exists()
 
 
+def test_save_skips_unchanged_index(tmp_path, monkeypatch):
+    index = SessionIndex(tmp_path / "index.json")
+    index.add(
+        SessionIndexEntry(
+            session_id="x",
+            status="completed",
+            bundle="b",
+            created_at="2026-03-03T10:00:00Z",
+            last_activity="2026-03-03T10:00:00Z",
+        )
+    )
+    index.save()
+
+    replaced = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        replaced.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", counting_replace)
+    index.update("x", status="completed")
+    index.save()
+    assert replaced == []
+
+    index.update("x", status="idle")
+    index.save()
+    assert len(replaced) == 1
+    assert json.loads((tmp_path / "index.json").read_text())[0]["status"] == "idle"
+
+
+def test_save_repairs_clobbered_index(tmp_path):
+    index = SessionIndex(tmp_path / "index.json")
+    index.add(
+        SessionIndexEntry(
+            session_id="x",
+            status="completed",
+            bundle="b",
+            created_at="2026-03-03T10:00:00Z",
+            last_activity="2026-03-03T10:00:00Z",
+        )
+    )
+    index.save()
+
+    (tmp_path / "index.json").write_text("marker")
+    index.save()
+    assert json.loads((tmp_path / "index.json").read_text())[0]["session_id"] == "x"
+
+    (tmp_path / "index.json").unlink()
+    index.save()
+    assert json.loads((tmp_path / "index.json").read_text())[0]["session_id"] == "x"
+
+
 def test_rebuild_from_session_dirs(tmp_path):
     """Rebuild index by scanning session directories."""
     sessions_dir = tmp_path / "sessions"
@@ -60,6 +114,14 @@ def test_rebuild_from_session_dirs(tmp_path):
     assert entry.created_at == "2026-03-03T10:00:00Z"
 
 
+def test_rebuild_skips_plain_files_and_dirs_without_metadata(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    (sessions_dir / "no-meta").mkdir(parents=True)
+    (sessions_dir / "index.json").write_text("[]")
+    index = SessionIndex.rebuild(sessions_dir)
+    assert index.list_entries() == []
+
+
 def test_load_corrupted_falls_back_to_empty(tmp_path):
     (tmp_path / "index.json").write_text("NOT VALID JSON")
     index = SessionIndex.load(tmp_path / "index.json")
@@ -121,3 +183,14 @@ def test_remove_entry(tmp_path):
 def test_get_missing_returns_none(tmp_path):
     index = SessionIndex(tmp_path / "index.json")
     assert index.get("no-such-id") is None
+
+
+def test_failed_save_leaves_no_temp_file(tmp_path, monkeypatch):
+    def _failing_replace(src, dst):
+        raise OSError("disk full")
+
+    index = SessionIndex(tmp_path / "index.json")
+    monkeypatch.setattr(os, "replace", _failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        index.save()
+    assert list(tmp_path.iterdir()) == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -30,7 +31,7 @@ class TestSessionManager:
     def test_get_nonexistent(self, manager: SessionManager) -> None:
         assert manager.get("nonexistent") is None
 
-    async def test_register_and_get(self, manager: SessionManager) -> None:
+    def test_register_and_get(self, manager: SessionManager) -> None:
         """Register a pre-built SessionHandle and retrieve it."""
         mock_session = MagicMock()
         mock_session.session_id = "test-123"
@@ -59,7 +60,7 @@ class TestSessionManager:
         await manager.destroy("to-destroy")
         assert manager.get("to-destroy") is None
 
-    async def test_list_sessions(self, manager: SessionManager) -> None:
+    def test_list_sessions(self, manager: SessionManager) -> None:
         for i in range(3):
             mock = MagicMock()
             mock.session_id = f"session-{i}"
@@ -70,3 +71,32 @@ class TestSessionManager:
         assert len(sessions) == 3
         ids = {s["session_id"] for s in sessions}
         assert ids == {"session-0", "session-1", "session-2"}
+
+    def test_list_sessions_filters_by_parent(self, manager: SessionManager) -> None:
+        for sid, parent in [
+            ("root", None),
+            ("child-a", "root"),
+            ("child-b", "root"),
+            ("other", "x"),
+        ]:
+            mock = MagicMock()
+            mock.session_id = sid
+            mock.parent_id = parent
+            manager.register(session=mock, prepared_bundle=None, bundle_name="b")
+
+        children = manager.list_sessions(parent_session_id="root")
+        assert {s["session_id"] for s in children} == {"child-a", "child-b"}
+        assert len(manager.list_sessions()) == 4
+
+    async def test_session_count_matches_list_sessions(
+        self, bus: EventBus, settings: DaemonSettings, tmp_path: Path
+    ) -> None:
+        manager = SessionManager(event_bus=bus, settings=settings, sessions_dir=tmp_path)
+        for sid in ("live-1", "live-2"):
+            mock = MagicMock()
+            mock.session_id = sid
+            mock.parent_id = None
+            mock.cleanup = AsyncMock()
+            manager.register(session=mock, prepared_bundle=None, bundle_name="b")
+        await manager.destroy("live-2")  # now historical only
+        assert manager.session_count() == len(manager.list_sessions()) == 2
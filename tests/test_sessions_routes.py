@@ -94,29 +94,26 @@ class TestSessionListEndpoint:
 
 
 @pytest.mark.unit
-class TestSessionGetEndpoint:
-    """Tests for GET /sessions/{session_id}."""
-
-    def test_get_not_found(self, client: TestClient) -> None:
-        """GET /sessions/nonexistent returns 404 with RFC 7807 ProblemDetail."""
-        resp = client.get("/sessions/nonexistent")
-        assert resp.status_code == 404
-        data = resp.json()
-        detail = data["detail"]
-        assert detail["type"] == "https://amplifier.dev/errors/session-not-found"
-        assert detail["status"] == 404
-
-
-@pytest.mark.unit
-class TestSessionDeleteEndpoint:
-    """Tests for DELETE /sessions/{session_id}."""
-
-    def test_delete_not_found(self, client: TestClient) -> None:
-        """DELETE /sessions/nonexistent returns 404 with RFC 7807 ProblemDetail."""
-        resp = client.delete("/sessions/nonexistent")
+class TestSessionNotFound:
+    """Every per-session endpoint returns a 404 ProblemDetail for an unknown id."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "body"),
+        [
+            ("GET", "/sessions/nonexistent", None),
+            ("DELETE", "/sessions/nonexistent", None),
+            ("PATCH", "/sessions/nonexistent", {"working_dir": "/x"}),
+            ("PATCH", "/sessions/ghost", {"name": "Ghost"}),
+            ("POST", "/sessions/nonexistent/cancel", {"immediate": False}),
+            ("POST", "/sessions/nonexistent/stale", None),
+        ],
+    )
+    def test_unknown_session_returns_404(
+        self, client: TestClient, method: str, path: str, body: dict | None
+    ) -> None:
+        resp = client.request(method, path, json=body)
         assert resp.status_code == 404
-        data = resp.json()
-        detail = data["detail"]
+        detail = resp.json()["detail"]
         assert detail["type"] == "https://amplifier.dev/errors/session-not-found"
         assert detail["status"] == 404
 
@@ -206,11 +203,6 @@ class TestSessionPatchEndpoint:
         assert "status" in data
         assert "bundle" in data
 
-    def test_patch_not_found(self, client: TestClient) -> None:
-        """PATCH /sessions/nonexistent returns 404."""
-        resp = client.patch("/sessions/nonexistent", json={"working_dir": "/x"})
-        assert resp.status_code == 404
-
 
 @pytest.mark.unit
 class TestSessionDeleteExisting:
@@ -246,11 +238,6 @@ class TestSessionCancelEndpoint:
         data = resp.json()
         assert data["state"] == "graceful"
 
-    def test_cancel_not_found(self, client: TestClient) -> None:
-        """Cancel on nonexistent session returns 404."""
-        resp = client.post("/sessions/nonexistent/cancel", json={"immediate": False})
-        assert resp.status_code == 404
-
 
 @pytest.mark.unit
 class TestSessionStaleEndpoint:
@@ -265,11 +252,6 @@ class TestSessionStaleEndpoint:
         assert data["session_id"] == "sess-s"
         assert data["stale"] is True
 
-    def test_stale_not_found(self, client: TestClient) -> None:
-        """POST stale on nonexistent session returns 404."""
-        resp = client.post("/sessions/nonexistent/stale")
-        assert resp.status_code == 404
-
 
 @pytest.mark.unit
 class TestSessionPatchNameEndpoint:
@@ -304,16 +286,14 @@ class TestSessionPatchNameEndpoint:
         metadata = json.loads(metadata_path.read_text())
         assert metadata.get("name") == "Renamed Session"
 
-    def test_patch_name_emits_session_renamed_event(self, client: TestClient) -> None:
+    def test_patch_name_emits_session_renamed_event(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """PATCH with name publishes session_renamed event on the EventBus."""
-        import asyncio
-
         _register_handle(client, "sess-evt")
         event_bus = client.app.state.event_bus
 
         published: list = []
-
-        # Monkey-patch publish to capture calls
         original_publish = event_bus.publish
 
         def _capture_publish(session_id, event_name, data, correlation_id=None):
@@ -325,13 +305,9 @@ class TestSessionPatchNameEndpoint:
                 correlation_id=correlation_id,
             )
 
-        event_bus.publish = _capture_publish
-
-        try:
-            resp = client.patch("/sessions/sess-evt", json={"name": "Emitted"})
-            assert resp.status_code == 200
-        finally:
-            event_bus.publish = original_publish
+        monkeypatch.setattr(event_bus, "publish", _capture_publish)
+        resp = client.patch("/sessions/sess-evt", json={"name": "Emitted"})
+        assert resp.status_code == 200
 
         rename_events = [e for e in published if e["event_name"] == "session_renamed"]
         assert len(rename_events) == 1
@@ -341,14 +317,9 @@ class TestSessionPatchNameEndpoint:
         assert evt["data"]["session_id"] == "sess-evt"
 
     def test_patch_name_no_sessions_dir_still_emits_event(
-        self, client: TestClient
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """PATCH with name emits event even when sessions_dir is not configured."""
-        import asyncio
-        from amplifierd.state.session_manager import SessionManager
-        from amplifierd.state.event_bus import EventBus
-        from amplifierd.config import DaemonSettings
-
         # Replace manager with one that has sessions_dir=None
         event_bus = EventBus()
         settings = DaemonSettings()
@@ -373,18 +344,10 @@ class TestSessionPatchNameEndpoint:
                 correlation_id=correlation_id,
             )
 
-        event_bus.publish = _capture
-        try:
-            resp = client.patch("/sessions/sess-nodir", json={"name": "NoDir"})
-            assert resp.status_code == 200
-        finally:
-            event_bus.publish = original_publish
+        monkeypatch.setattr(event_bus, "publish", _capture)
+        resp = client.patch("/sessions/sess-nodir", json={"name": "NoDir"})
+        assert resp.status_code == 200
 
         rename_events = [e for e in published if e["event_name"] == "session_renamed"]
         assert len(rename_events) == 1
         assert rename_events[0]["data"]["name"] == "NoDir"
-
-    def test_patch_name_not_found(self, client: TestClient) -> None:
-        """PATCH with name on nonexistent session returns 404."""
-        resp = client.patch("/sessions/ghost", json={"name": "Ghost"})
-        assert resp.status_code == 404
@@ -91,6 +91,25 @@ def test_get_transcript_skips_malformed_lines(client: TestClient, sessions_dir:
     assert len(data["messages"]) == 2
 
 
+def test_get_transcript_keeps_unicode_line_separators(
+    client: TestClient, sessions_dir: Path
+) -> None:
+    """U+2028/U+2029/U+0085 inside a message do not split its JSONL line."""
+    sid = "session-separators"
+    sdir = sessions_dir / sid
+    sdir.mkdir(parents=True)
+    content = "one\u2028two\u2029three\x85four"
+    (sdir / "transcript.jsonl").write_text(
+        json.dumps({"role": "user", "content": content}, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+
+    resp = client.get(f"/sessions/{sid}/transcript")
+
+    assert resp.status_code == 200
+    assert [m["content"] for m in resp.json()["messages"]] == [content]
+
+
 def test_get_transcript_empty_file(client: TestClient, sessions_dir: Path) -> None:
     """GET /sessions/{id}/transcript returns empty messages for empty transcript."""
     sid = "session-empty"
@@ -103,3 +122,58 @@ def test_get_transcript_empty_file(client: TestClient, sessions_dir: Path) -> No
     assert resp.status_code == 200
     data = resp.json()
     assert data["messages"] == []
+
+
+def test_get_transcript_reuses_parse_until_file_changes(
+    client: TestClient, sessions_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeat reads of an unchanged transcript skip re-parsing; a write invalidates."""
+    import amplifierd.routes.sessions as sessions_routes
+
+    sid = "session-cached"
+    sdir = sessions_dir / sid
+    sdir.mkdir(parents=True)
+    transcript = sdir / "transcript.jsonl"
+    transcript.write_text(json.dumps({"role": "user", "content": "hello"}) + "\n")
+
+    loads: list[Path] = []
+    real_load = sessions_routes.load_transcript
+
+    def _counting_load(session_dir: Path) -> list[dict]:
+        loads.append(session_dir)
+        return real_load(session_dir)
+
+    monkeypatch.setattr(sessions_routes, "load_transcript", _counting_load)
+
+    first = client.get(f"/sessions/{sid}/transcript").json()
+    second = client.get(f"/sessions/{sid}/transcript").json()
+    assert first == second
+    assert len(loads) == 1
+
+    with transcript.open("a") as fh:
+        fh.write(json.dumps({"role": "assistant", "content": "hi"}) + "\n")
+    third = client.get(f"/sessions/{sid}/transcript").json()
+    assert len(third["messages"]) == 2
+    assert third["revision"] != first["revision"]
+    assert len(loads) == 2
+
+
+def test_transcript_cache_is_bounded_by_total_size(
+    client: TestClient, sessions_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached transcripts stay under the byte cap; oversized ones are not cached."""
+    import amplifierd.routes.sessions as sessions_routes
+
+    line = json.dumps({"role": "user", "content": "x" * 80}) + "\n"
+    monkeypatch.setattr(sessions_routes, "_TRANSCRIPT_CACHE_MAX_BYTES", 2 * len(line))
+    monkeypatch.setattr(sessions_routes, "_transcript_cache", {})
+
+    paths = []
+    for sid, lines in [("a", 1), ("b", 1), ("c", 1), ("big", 3)]:
+        sdir = sessions_dir / sid
+        sdir.mkdir()
+        (sdir / "transcript.jsonl").write_text(line * lines)
+        paths.append(sdir / "transcript.jsonl")
+        assert client.get(f"/sessions/{sid}/transcript").status_code == 200
+
+    assert list(sessions_routes._transcript_cache) == paths[1:3]
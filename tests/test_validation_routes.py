@@ -13,6 +13,7 @@ from amplifierd.app import create_app
 from amplifierd.config import DaemonSettings
 from amplifierd.state.event_bus import EventBus
 from amplifierd.state.session_manager import SessionManager
+from tests.helpers import ConcurrencyProbe
 
 # -- Helpers --
 
@@ -305,6 +306,24 @@ class TestReloadBundles:
         assert "bundle-a" in reloaded
         assert "bundle-b" in reloaded
 
+    def test_reloads_run_concurrently(self, client: TestClient, app: FastAPI) -> None:
+        """POST /reload/bundles overlaps load() calls and keeps result order."""
+        probe = ConcurrencyProbe()
+
+        def fake_load(source: str) -> SimpleNamespace:
+            if source == "broken":
+                raise RuntimeError("boom")
+            return SimpleNamespace(name=source, version="1.0.0")
+
+        app.state.bundle_registry = SimpleNamespace(
+            list_registered=lambda: ["bundle-a", "broken", "bundle-b"],
+            load=probe.wrap(fake_load),
+        )
+        data = client.post("/reload/bundles").json()
+        assert probe.peak == 3
+        assert data["reloaded"] == ["bundle-a", "bundle-b"]
+        assert data["failed"] == ["broken"]
+
     def test_returns_empty_reloaded_when_no_bundles_registered(
         self, client: TestClient, app: FastAPI
     ) -> None:
@@ -412,6 +431,27 @@ class TestReloadStatus:
         data = resp.json()
         assert data["bundles"] == []
 
+    def test_update_checks_run_concurrently(self, client: TestClient, app: FastAPI) -> None:
+        """GET /reload/status overlaps check_update() calls and keeps result order."""
+        probe = ConcurrencyProbe()
+
+        def fake_check_update(name: str) -> SimpleNamespace | None:
+            if name == "broken":
+                raise RuntimeError("boom")
+            return SimpleNamespace(available_version="2.0.0") if name == "stale" else None
+
+        app.state.bundle_registry = SimpleNamespace(
+            list_registered=lambda: ["fresh", "broken", "stale"],
+            get_state=lambda name: SimpleNamespace(version="1.0.0"),
+            check_update=probe.wrap(fake_check_update),
+        )
+        resp = client.get("/reload/status")
+        assert resp.status_code == 200
+        bundles = resp.json()["bundles"]
+        assert probe.peak == 3
+        assert [b["name"] for b in bundles] == ["fresh", "broken", "stale"]
+        assert [b["has_update"] for b in bundles] == [False, False, True]
+
 
 # -- Router registration --
 